@@ -1,5 +1,6 @@
 """This module defines classes to represent an Fondant component specification."""
 import copy
+import functools
 import json
 import pkgutil
 import re
@@ -18,6 +19,25 @@ from referencing.jsonschema import DRAFT4
 from fondant.core.exceptions import InvalidComponentSpec, InvalidPipelineDefinition
 from fondant.core.schema import Field, Type
 
+SCHEMAS_PATH = Path(__file__).parent / "schemas"
+
+
+@functools.lru_cache(maxsize=None)
+def _retrieve_from_filesystem(uri: str) -> Resource:
+    path = SCHEMAS_PATH / uri
+    contents = json.loads(path.read_text())
+    return Resource.from_contents(contents, default_specification=DRAFT4)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(spec_str: str) -> Draft4Validator:
+    """Create a validator for the provided schema. The validator is cached so the schema is
+    only parsed and compiled once per process.
+    """
+    spec_schema = json.loads(spec_str)
+    registry = Registry(retrieve=_retrieve_from_filesystem)  # type: ignore
+    return Draft4Validator(spec_schema, registry=registry)  # type: ignore
+
 
 @dataclass
 class Argument:
@@ -90,18 +110,7 @@ class ComponentSpec:
             msg = "component_spec.json not found in fondant schema"
             raise FileNotFoundError(msg)
 
-        spec_str = spec_data.decode("utf-8")
-        spec_schema = json.loads(spec_str)
-
-        base_uri = Path(__file__).parent / "schemas"
-
-        def retrieve_from_filesystem(uri: str) -> Resource:
-            path = base_uri / uri
-            contents = json.loads(path.read_text())
-            return Resource.from_contents(contents, default_specification=DRAFT4)
-
-        registry = Registry(retrieve=retrieve_from_filesystem)  # type: ignore
-        validator = Draft4Validator(spec_schema, registry=registry)  # type: ignore
+        validator = _get_validator(spec_data.decode("utf-8"))
 
         try:
             validator.validate(self._specification)
@@ -118,7 +127,11 @@ class ComponentSpec:
     def to_file(self, path) -> None:
         """Dump the component spec to the file specified by the provided path."""
         with open(path, "w", encoding="utf-8") as file_:
-            yaml.dump(self._specification, file_)
+            self.to_stream(file_)
+
+    def to_stream(self, stream: t.TextIO) -> None:
+        """Dump the component spec to the provided text stream."""
+        yaml.dump(self._specification, stream)
 
     @property
     def name(self):
@@ -544,13 +557,17 @@ class KubeflowComponentSpec:
     def to_file(self, path: t.Union[str, Path]) -> None:
         """Dump the component specification to the file specified by the provided path."""
         with open(path, "w", encoding="utf-8") as file_:
-            yaml.dump(
-                self._specification,
-                file_,
-                indent=4,
-                default_flow_style=False,
-                sort_keys=False,
-            )
+            self.to_stream(file_)
+
+    def to_stream(self, stream: t.TextIO) -> None:
+        """Dump the component specification to the provided text stream."""
+        yaml.dump(
+            self._specification,
+            stream,
+            indent=4,
+            default_flow_style=False,
+            sort_keys=False,
+        )
 
     def to_string(self) -> str:
         """Return the component specification as a string."""
@@ -1,8 +1,8 @@
 """Fondant component specs test."""
+import functools
+import io
 import os
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 import yaml
@@ -14,47 +14,79 @@ from fondant.core.exceptions import InvalidComponentSpec
 from fondant.core.schema import Type
 
 component_specs_path = Path(__file__).parent / "examples/component_specs"
+VALID_COMPONENT = os.fspath(component_specs_path / "valid_component.yaml")
+VALID_COMPONENT_NO_ARGS = os.fspath(
+    component_specs_path / "valid_component_no_args.yaml",
+)
+KUBEFLOW_COMPONENT = os.fspath(component_specs_path / "kubeflow_component.yaml")
+INVALID_COMPONENT = os.fspath(component_specs_path / "invalid_component.yaml")
+GENERIC_CONSUMES_COMPONENT = os.fspath(component_specs_path / "generic_consumes.yaml")
+GENERIC_PRODUCES_COMPONENT = os.fspath(component_specs_path / "generic_produces.yaml")
+
+# Prefer the libyaml backed loader when PyYAML was built with it
+_load = yaml.CSafeLoader if hasattr(yaml, "CSafeLoader") else yaml.SafeLoader
+
 
+@functools.lru_cache(maxsize=None)
+def _load_yaml(path: str) -> dict:
+    # Read as bytes so libyaml handles the decoding
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_load)
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def valid_fondant_schema() -> dict:
-    with open(component_specs_path / "valid_component.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(VALID_COMPONENT)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def valid_fondant_schema_no_args() -> dict:
-    with open(component_specs_path / "valid_component_no_args.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(VALID_COMPONENT_NO_ARGS)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def valid_kubeflow_schema() -> dict:
-    with open(component_specs_path / "kubeflow_component.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(KUBEFLOW_COMPONENT)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def invalid_fondant_schema() -> dict:
-    with open(component_specs_path / "invalid_component.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(INVALID_COMPONENT)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def valid_fondant_schema_generic_consumes() -> dict:
-    with open(component_specs_path / "generic_consumes.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(GENERIC_CONSUMES_COMPONENT)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def valid_fondant_schema_generic_produces() -> dict:
-    with open(component_specs_path / "generic_produces.yaml") as f:
-        return yaml.safe_load(f)
+    return _load_yaml(GENERIC_PRODUCES_COMPONENT)
+
+
+@pytest.fixture(scope="session")
+def valid_component(valid_fondant_schema) -> ComponentSpec:
+    return ComponentSpec(valid_fondant_schema)
+
+
+@pytest.fixture(scope="session")
+def valid_component_no_args(valid_fondant_schema_no_args) -> ComponentSpec:
+    return ComponentSpec(valid_fondant_schema_no_args)
+
+
+@pytest.fixture(scope="session")
+def generic_consumes_component(valid_fondant_schema_generic_consumes) -> ComponentSpec:
+    return ComponentSpec(valid_fondant_schema_generic_consumes)
+
 
+@pytest.fixture(scope="session")
+def generic_produces_component(valid_fondant_schema_generic_produces) -> ComponentSpec:
+    return ComponentSpec(valid_fondant_schema_generic_produces)
 
-@patch("pkgutil.get_data", return_value=None)
-def test_component_spec_pkgutil_error(mock_get_data):
+
+def test_component_spec_pkgutil_error(monkeypatch):
     """Test that FileNotFoundError is raised when pkgutil.get_data returns None."""
+    monkeypatch.setattr("pkgutil.get_data", lambda *args, **kwargs: None)
     with pytest.raises(FileNotFoundError):
         ComponentSpec("example_component.yaml")
 
@@ -69,81 +101,92 @@ def test_component_spec_validation(valid_fondant_schema, invalid_fondant_schema)
 def test_component_spec_load_from_file(valid_fondant_schema, invalid_fondant_schema):
     """Test that the component spec is validated correctly on instantiation."""
     ComponentSpec.from_file(component_specs_path / "valid_component.yaml")
+    ComponentSpec.from_file(VALID_COMPONENT)
     with pytest.raises(InvalidComponentSpec):
         ComponentSpec.from_file(component_specs_path / "invalid_component.yaml")
 
 
-def test_attribute_access(valid_fondant_schema):
+def test_attribute_access(valid_component):
     """
     Test that attributes can be accessed as expected:
     - Fixed properties should be accessible as an attribute
     - Dynamic properties should be accessible by lookup.
     """
-    fondant_component = ComponentSpec(valid_fondant_schema)
-
-    assert fondant_component.name == "Example component"
-    assert fondant_component.description == "This is an example component"
-    assert fondant_component.consumes["images"].type == Type("binary")
-    assert fondant_component.consumes["embeddings"].type == Type.list(
+    assert valid_component.name == "Example component"
+    assert valid_component.description == "This is an example component"
+    assert valid_component.consumes["images"].type == Type("binary")
+    assert valid_component.consumes["embeddings"].type == Type.list(
         Type("float32"),
     )
 
 
-def test_kfp_component_creation(valid_fondant_schema, valid_kubeflow_schema):
+def test_kfp_component_creation(valid_component, valid_kubeflow_schema):
     """Test that the created kubeflow component matches the expected kubeflow component."""
-    fondant_component = ComponentSpec(valid_fondant_schema)
-    kubeflow_component = fondant_component.kubeflow_specification
-    with open("./new_spec", "w") as f:
-        import json
-
-        json.dump(kubeflow_component._specification, f)
+    kubeflow_component = valid_component.kubeflow_specification
     assert kubeflow_component._specification == valid_kubeflow_schema
 
 
-def test_component_spec_no_args(valid_fondant_schema_no_args):
+def test_component_spec_no_args(valid_component_no_args):
     """Test that a component spec without args is supported."""
-    fondant_component = ComponentSpec(valid_fondant_schema_no_args)
+    assert valid_component_no_args.name == "Example component"
+    assert valid_component_no_args.description == "This is an example component"
+    assert valid_component_no_args.args == valid_component_no_args.default_arguments
 
-    assert fondant_component.name == "Example component"
-    assert fondant_component.description == "This is an example component"
-    assert fondant_component.args == fondant_component.default_arguments
 
-
-def test_component_spec_to_file(valid_fondant_schema):
+def test_component_spec_to_file(valid_component, valid_fondant_schema, tmp_path):
     """Test that the ComponentSpec can be written to a file."""
-    component_spec = ComponentSpec(valid_fondant_schema)
+    file_path = tmp_path / "component_spec.yaml"
+    valid_component.to_file(file_path)
+
+    with open(file_path) as f:
+        written_data = yaml.load(f, Loader=_load)
+
+    # check if the written data is the same as the original data
+    assert written_data == valid_fondant_schema
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file_path = os.path.join(temp_dir, "component_spec.yaml")
-        component_spec.to_file(file_path)
 
-        with open(file_path) as f:
-            written_data = yaml.safe_load(f)
+def test_component_spec_to_stream(valid_component, valid_fondant_schema):
+    """Test that the ComponentSpec can be written to a stream."""
+    buffer = io.StringIO()
+    valid_component.to_stream(buffer)
+    buffer.seek(0)
+    written_data = yaml.load(buffer, Loader=_load)
 
-        # check if the written data is the same as the original data
-        assert written_data == valid_fondant_schema
+    # check if the written data is the same as the original data
+    assert written_data == valid_fondant_schema
 
 
-def test_kubeflow_component_spec_to_file(valid_kubeflow_schema):
+def test_kubeflow_component_spec_to_file(valid_kubeflow_schema, tmp_path):
     """Test that the KubeflowComponentSpec can be written to a file."""
     kubeflow_component_spec = KubeflowComponentSpec(valid_kubeflow_schema)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file_path = os.path.join(temp_dir, "kubeflow_component_spec.yaml")
-        kubeflow_component_spec.to_file(file_path)
+    file_path = tmp_path / "kubeflow_component_spec.yaml"
+    kubeflow_component_spec.to_file(file_path)
+
+    with open(file_path) as f:
+        written_data = yaml.load(f, Loader=_load)
+
+    # check if the written data is the same as the original data
+    assert written_data == valid_kubeflow_schema
+
+
+def test_kubeflow_component_spec_to_stream(valid_kubeflow_schema):
+    """Test that the KubeflowComponentSpec can be written to a stream."""
+    kubeflow_component_spec = KubeflowComponentSpec(valid_kubeflow_schema)
 
-        with open(file_path) as f:
-            written_data = yaml.safe_load(f)
+    buffer = io.StringIO()
+    kubeflow_component_spec.to_stream(buffer)
+    buffer.seek(0)
+    written_data = yaml.load(buffer, Loader=_load)
 
-        # check if the written data is the same as the original data
-        assert written_data == valid_kubeflow_schema
+    # check if the written data is the same as the original data
+    assert written_data == valid_kubeflow_schema
 
 
-def test_component_spec_repr(valid_fondant_schema):
+def test_component_spec_repr(valid_component, valid_fondant_schema):
     """Test that the __repr__ method of ComponentSpec returns the expected string."""
-    fondant_component = ComponentSpec(valid_fondant_schema)
     expected_repr = f"ComponentSpec({valid_fondant_schema!r})"
-    assert repr(fondant_component) == expected_repr
+    assert repr(valid_component) == expected_repr
 
 
 def test_kubeflow_component_spec_repr(valid_kubeflow_schema):
@@ -153,15 +196,13 @@ def test_kubeflow_component_spec_repr(valid_kubeflow_schema):
     assert repr(kubeflow_component_spec) == expected_repr
 
 
-def test_component_spec_generic_consumes(valid_fondant_schema_generic_consumes):
+def test_component_spec_generic_consumes(generic_consumes_component):
     """Test that a component spec with generic consumes is detected."""
-    component_spec = ComponentSpec(valid_fondant_schema_generic_consumes)
-    assert component_spec.is_generic("consumes") is True
-    assert component_spec.is_generic("produces") is False
+    assert generic_consumes_component.is_generic("consumes") is True
+    assert generic_consumes_component.is_generic("produces") is False
 
 
-def test_component_spec_generic_produces(valid_fondant_schema_generic_produces):
+def test_component_spec_generic_produces(generic_produces_component):
     """Test that a component spec with generic produces is detected."""
-    component_spec = ComponentSpec(valid_fondant_schema_generic_produces)
-    assert component_spec.is_generic("consumes") is False
-    assert component_spec.is_generic("produces") is True
+    assert generic_produces_component.is_generic("consumes") is False
+    assert generic_produces_component.is_generic("produces") is True
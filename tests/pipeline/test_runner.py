@@ -13,12 +13,16 @@ from fondant.pipeline.runner import (
 )
 
 VALID_PIPELINE = Path("./tests/pipeline/examples/pipelines/compiled_pipeline/")
+KUBEFLOW_SPEC_PATH = str(VALID_PIPELINE / "kubeflow_pipeline.yml")
 
-PIPELINE = Pipeline(
-    name="testpipeline",
-    description="description of the test pipeline",
-    base_path="/foo/bar",
-)
+
+@pytest.fixture(scope="session")
+def pipeline():
+    return Pipeline(
+        name="testpipeline",
+        description="description of the test pipeline",
+        base_path="/foo/bar",
+    )
 
 
 def test_docker_runner():
@@ -40,9 +44,9 @@ def test_docker_runner():
         )
 
 
-def test_docker_runner_from_pipeline():
+def test_docker_runner_from_pipeline(pipeline):
     with mock.patch("subprocess.call") as mock_call:
-        DockerRunner().run(PIPELINE)
+        DockerRunner().run(pipeline)
         mock_call.assert_called_once_with(
             [
                 "docker",
@@ -77,34 +81,33 @@ class MockKfpClient:
         return SimpleNamespace(run_id="xyz")
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _patch_kfp_client():
+    with mock.patch("kfp.Client", new=MockKfpClient):
+        yield
+
+
+@pytest.fixture()
+def _patch_boto3_client():
+    with mock.patch("boto3.client", spec=True):
+        yield
+
+
 def test_kubeflow_runner():
-    input_spec_path = str(VALID_PIPELINE / "kubeflow_pipeline.yml")
-    with mock.patch(
-        "kfp.Client",
-        new=MockKfpClient,
-    ):
-        runner = KubeflowRunner(host="some_host")
-        runner.run(input=input_spec_path)
+    runner = KubeflowRunner(host="some_host")
+    runner.run(input=KUBEFLOW_SPEC_PATH)
 
-        assert runner.client.host == "some_host"
+    assert runner.client.host == "some_host"
 
 
 def test_kubeflow_runner_new_experiment():
-    input_spec_path = str(VALID_PIPELINE / "kubeflow_pipeline.yml")
-    with mock.patch(
-        "kfp.Client",
-        new=MockKfpClient,
-    ):
-        runner = KubeflowRunner(host="some_host")
-        runner.run(input=input_spec_path, experiment_name="NewExperiment")
+    runner = KubeflowRunner(host="some_host")
+    runner.run(input=KUBEFLOW_SPEC_PATH, experiment_name="NewExperiment")
 
 
 def test_kfp_import():
     """Test that the kfp import throws the correct error."""
-    with mock.patch.dict(sys.modules), mock.patch(
-        "kfp.Client",
-        new=MockKfpClient,
-    ):
+    with mock.patch.dict(sys.modules):
         # remove kfp from the modules
         sys.modules["kfp"] = None
         with pytest.raises(ImportError):
@@ -121,19 +124,16 @@ class MockKubeFlowCompiler:
             f.write("foo: bar")
 
 
-def test_kubeflow_runner_from_pipeline():
+def test_kubeflow_runner_from_pipeline(pipeline):
     with mock.patch(
         "fondant.pipeline.runner.KubeFlowCompiler",
         new=MockKubeFlowCompiler,
     ), mock.patch(
         "fondant.pipeline.runner.KubeflowRunner._run",
-    ) as mock_run, mock.patch(
-        "kfp.Client",
-        new=MockKfpClient,
-    ):
+    ) as mock_run:
         runner = KubeflowRunner(host="some_host")
         runner.run(
-            input=PIPELINE,
+            input=pipeline,
         )
 
         mock_run.assert_called_once_with(
@@ -142,24 +142,26 @@ def test_kubeflow_runner_from_pipeline():
         )
 
 
-def test_vertex_runner():
-    input_spec_path = str(VALID_PIPELINE / "kubeflow_pipeline.yml")
+@pytest.fixture()
+def _patch_aiplatform():
     with mock.patch("google.cloud.aiplatform.init", return_value=None), mock.patch(
         "google.cloud.aiplatform.PipelineJob",
     ):
-        runner = VertexRunner(project_id="some_project", region="some_region")
-        runner.run(input=input_spec_path)
+        yield
 
-        # test with service account
-        runner2 = VertexRunner(
-            project_id="some_project",
-            region="some_region",
-            service_account="some_account",
-        )
-        runner2.run(input=input_spec_path)
 
+@pytest.mark.usefixtures("_patch_aiplatform")
+@pytest.mark.parametrize("service_account", [None, "some_account"])
+def test_vertex_runner(service_account):
+    runner = VertexRunner(
+        project_id="some_project",
+        region="some_region",
+        service_account=service_account,
+    )
+    runner.run(input=KUBEFLOW_SPEC_PATH)
 
-def test_vertex_runner_from_pipeline():
+
+def test_vertex_runner_from_pipeline(pipeline):
     with mock.patch(
         "fondant.pipeline.runner.VertexCompiler",
         new=MockKubeFlowCompiler,
@@ -169,23 +171,21 @@ def test_vertex_runner_from_pipeline():
     ):
         runner = VertexRunner(project_id="some_project", region="some_region")
         runner.run(
-            input=PIPELINE,
+            input=pipeline,
         )
 
         mock_run.assert_called_once_with(".fondant/vertex-pipeline.yaml")
 
 
-def test_sagemaker_runner(tmp_path_factory):
-    with mock.patch("boto3.client", spec=True), tmp_path_factory.mktemp(
-        "temp",
-    ) as tmpdir:
-        # create a small temporary spec file
-        with open(tmpdir / "spec.json", "w") as f:
-            f.write('{"pipelineInfo": {"name": "pipeline_1"}}')
+@pytest.mark.usefixtures("_patch_boto3_client")
+def test_sagemaker_runner():
+    # serve a small spec from memory instead of writing it to disk
+    spec = mock.mock_open(read_data='{"pipelineInfo": {"name": "pipeline_1"}}')
+    with mock.patch("fondant.pipeline.runner.open", spec, create=True):
         runner = SagemakerRunner()
 
         runner.run(
-            input=tmpdir / "spec.json",
+            input="spec.json",
             pipeline_name="pipeline_1",
             role_arn="arn:something",
         )
@@ -211,7 +211,7 @@ def test_sagemaker_runner(tmp_path_factory):
         )
 
         runner.run(
-            input=tmpdir / "spec.json",
+            input="spec.json",
             pipeline_name="pipeline_1",
             role_arn="arn:something",
         )
@@ -242,14 +242,15 @@ class MockSagemakerCompiler:
             f.write("foo: bar")
 
 
-def test_sagemaker_runner_from_pipeline():
+@pytest.mark.usefixtures("_patch_boto3_client")
+def test_sagemaker_runner_from_pipeline(pipeline):
     with mock.patch(
         "fondant.pipeline.runner.SagemakerCompiler",
         new=MockSagemakerCompiler,
-    ), mock.patch("boto3.client", spec=True):
+    ):
         runner = SagemakerRunner()
         runner.run(
-            input=PIPELINE,
-            pipeline_name=PIPELINE.name,
+            input=pipeline,
+            pipeline_name=pipeline.name,
             role_arn="arn:something",
         )